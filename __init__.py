@@ -1,2 +1,8 @@
 from .fragment import Fragment 
 from .munition import Munition 
+from .closest_approach import closest_approach, closest_approach_arrays 
+from .parallel import run_trajectories, TrajectoryResults 
+from .spawn import spawn_from_polar_zones, fragment_kwargs 
+from .footprint import FootprintGrid 
+from .storage import PackedTrajectory, pack, pack_batch 
+from .service import SimulationService 
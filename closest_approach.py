@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+from astropy import units
+from kinematics.utils import Point, CoordinateFrame
+
+
+def closest_approach(fragments, assets, frame=None, chunk_size=256):
+    """Returns the minimum distance and time of closest approach between
+        every stored trajectory and every asset.
+
+        Each trajectory is treated as a piecewise linear path between its
+        stored steps.  Segments are grouped into chunks, chunks whose
+        bounding box cannot beat the best distance found so far are pruned,
+        and the survivors are refined analytically by projecting the asset
+        onto each segment.
+
+        fragments (list(kinematics.Fragment) or list(pandas.DataFrame))
+            Fragments that have been run through run_3dof, or trajectory
+            tables with columns t, x, y, z in meters.
+
+        assets (list(kinematics.utils.Point))
+            Protected assets.  They are expressed in frame before comparing.
+
+        frame (kinematics.utils.CoordinateFrame)
+            Frame the trajectories are described in.  Defaults to the frame
+            of the first asset.
+
+        chunk_size (int)
+            Number of segments that share one bounding box.  Only chunks
+            whose box could hold a closer approach are refined.
+
+        Returns pandas.DataFrame with columns fragment, asset, distance, t.
+            One row per (fragment, asset) pair.  distance is in meters and t
+            in seconds.
+    """
+    if not all(isinstance(i, Point) for i in assets):
+        raise TypeError('Expected all elements of input assets to be of type '
+                        'kinematics.utils.Point.')
+
+    if frame is None and assets:
+        frame = assets[0].frame
+    if assets and not isinstance(frame, CoordinateFrame):
+        raise TypeError('Expected input frame to be of type CoordinateFrame.')
+
+    asset_xyz = np.array([[i.to(units.m).value
+                           for i in a.to_frame(frame).to_units_array()]
+                          for a in assets], dtype=np.float64).reshape(-1, 3)
+
+    rows = []
+    for f_idx, fragment in enumerate(fragments):
+        traj = getattr(fragment, 'trajDF', fragment)
+        t = traj['t'].to_numpy(dtype=np.float64)
+        xyz = traj[['x', 'y', 'z']].to_numpy(dtype=np.float64)
+
+        if len(t) == 0:
+            continue
+
+        dist, t_ca = closest_approach_arrays(t, xyz, asset_xyz, chunk_size)
+        for a_idx in range(len(asset_xyz)):
+            rows.append((f_idx, a_idx, dist[a_idx], t_ca[a_idx]))
+
+    return pd.DataFrame(rows, columns=['fragment', 'asset', 'distance', 't'])
+
+
+
+def closest_approach_arrays(t, xyz, assets, chunk_size=256):
+    """Vectorized closest approach of a single trajectory to many assets.
+
+        t (numpy.ndarray) shape (M,)
+        xyz (numpy.ndarray) shape (M, 3)
+        assets (numpy.ndarray) shape (K, 3)
+
+        Returns (distance, time) as two arrays of shape (K,).
+    """
+    t = np.asarray(t, dtype=np.float64)
+    xyz = np.asarray(xyz, dtype=np.float64)
+    assets = np.asarray(assets, dtype=np.float64).reshape(-1, 3)
+
+    best_d2 = np.full(len(assets), np.inf)
+    best_t = np.full(len(assets), np.nan)
+    if len(t) == 0 or len(assets) == 0:
+        return np.sqrt(best_d2), best_t
+
+    if len(t) == 1:
+        return np.sqrt(_sq_dist(assets, xyz[0])), np.full(len(assets), t[0])
+
+    p0 = xyz[:-1]
+    seg = xyz[1:] - p0
+    seg_len2 = np.einsum('ij,ij->i', seg, seg)
+
+    # One axis aligned bounding box per chunk of segments
+    starts = np.arange(0, len(p0), chunk_size)
+    box_lo = np.minimum(np.minimum.reduceat(xyz[:-1], starts),
+                        np.minimum.reduceat(xyz[1:], starts))
+    box_hi = np.maximum(np.maximum.reduceat(xyz[:-1], starts),
+                        np.maximum.reduceat(xyz[1:], starts))
+
+    # Lower bound on the distance from every asset to every chunk
+    gap = np.maximum(box_lo[None] - assets[:, None, :], 0) \
+        + np.maximum(assets[:, None, :] - box_hi[None], 0)
+    lower = np.einsum('kcj,kcj->kc', gap, gap)
+
+    # Upper bound from the steps at the chunk boundaries, so chunks that
+    # cannot beat it are skipped from the start.
+    ends = np.r_[starts, len(t) - 1]
+    d2 = _sq_dist(assets[:, None, :], xyz[None, ends, :])
+    idx = np.argmin(d2, axis=1)
+    best_d2 = d2[np.arange(len(assets)), idx]
+    best_t = t[ends[idx]]
+
+    # Visit the most promising chunks first to tighten the bound early
+    for c in np.argsort(lower.min(axis=0)):
+        active = np.nonzero(lower[:, c] < best_d2)[0]
+        if len(active) == 0:
+            continue
+        start, stop = starts[c], starts[c] + chunk_size
+
+        # Project each surviving asset onto every segment of the chunk
+        rel = assets[active, None, :] - p0[None, start:stop]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frac = np.einsum('ksj,sj->ks', rel, seg[start:stop]) \
+                / seg_len2[start:stop]
+        frac = np.clip(np.nan_to_num(frac), 0, 1)
+        d2 = _sq_dist(rel, frac[..., None] * seg[None, start:stop])
+
+        s = np.argmin(d2, axis=1)
+        d2 = d2[np.arange(len(active)), s]
+        f = frac[np.arange(len(active)), s]
+        s = s + start
+        t_seg = t[s] + f * (t[s + 1] - t[s])
+
+        better = d2 < best_d2[active]
+        best_d2[active[better]] = d2[better]
+        best_t[active[better]] = t_seg[better]
+
+    return np.sqrt(best_d2), best_t
+
+
+
+def _sq_dist(a, b):
+    """Squared euclidean distance along the last axis.
+    """
+    diff = a - b
+    return np.einsum('...j,...j->...', diff, diff)
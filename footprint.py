@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class FootprintGrid:
+    """Ground grid that accumulates fragment impacts as trajectories finish.
+        Memory is fixed by the grid size, not by the number of fragments, and
+        partial grids built by parallel workers can be merged.
+
+        Attributes:
+            x_min, y_min (float)
+                Lower left corner of the grid in meters
+            cell_size (float)
+                Edge length of a square cell in meters
+            shape (tuple(int, int))
+                Number of cells along (x, y)
+            counts (numpy.ndarray) shape (nx, ny)
+                Number of impacts per cell
+            energy_sum (numpy.ndarray) shape (nx, ny)
+                Total impact energy per cell in joules
+            energy_max (numpy.ndarray) shape (nx, ny)
+                Largest single impact energy per cell in joules
+            dropped (int)
+                Number of impacts that fell outside the grid
+    """
+
+    def __init__(self, x_min, y_min, cell_size, shape):
+        if cell_size <= 0:
+            raise ValueError('Expected input cell_size to be positive.')
+
+        self.x_min = float(x_min)
+        self.y_min = float(y_min)
+        self.cell_size = float(cell_size)
+        self.shape = tuple(int(i) for i in shape)
+
+        self.counts = np.zeros(self.shape, dtype=np.int64)
+        self.energy_sum = np.zeros(self.shape, dtype=np.float64)
+        self.energy_max = np.zeros(self.shape, dtype=np.float64)
+        self.dropped = 0
+
+
+    def __repr__(self):
+        return "{0}(x_min={1}, y_min={2}, cell_size={3}, shape={4}, " \
+               "impacts={5})".format(self.__class__.__name__, self.x_min,
+                                     self.y_min, self.cell_size, self.shape,
+                                     int(self.counts.sum()))
+
+
+    def __iadd__(self, other):
+        self.merge(other)
+        return self
+
+
+    @property
+    def energy_density(self):
+        """Impact energy per unit ground area in J/m^2.
+        """
+        return self.energy_sum / self.cell_size ** 2
+
+
+    def add(self, x, y, energy):
+        """Bins a batch of impacts.
+
+            x, y (array-like) impact ground coordinates in meters
+            energy (array-like) impact energy in joules
+        """
+        x, y, energy = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                           np.asarray(y, dtype=np.float64),
+                                           np.asarray(energy, dtype=np.float64))
+        x, y, energy = x.ravel(), y.ravel(), energy.ravel()
+
+        i = np.floor((x - self.x_min) / self.cell_size).astype(np.int64)
+        j = np.floor((y - self.y_min) / self.cell_size).astype(np.int64)
+        inside = (i >= 0) & (i < self.shape[0]) & (j >= 0) & (j < self.shape[1])
+        self.dropped += int(np.count_nonzero(~inside))
+
+        flat = np.ravel_multi_index((i[inside], j[inside]), self.shape)
+        energy = energy[inside]
+
+        # Work only on the touched cells so a single impact costs O(1), not
+        # O(grid cells).
+        cells, inverse = np.unique(flat, return_inverse=True)
+        self.counts.reshape(-1)[cells] += np.bincount(inverse)
+        self.energy_sum.reshape(-1)[cells] += np.bincount(inverse,
+                                                          weights=energy)
+        np.maximum.at(self.energy_max.reshape(-1), flat, energy)
+
+
+    def add_trajectory(self, trajDF, mass, ground_z=0):
+        """Bins the impact of a finished trajectory.
+
+            The impact is interpolated to where the trajectory first crosses
+            down through z = ground_z.  A trajectory that never crosses, i.e.
+            one stopped in mid-air by lowerKineticLimit or launched from
+            below ground, is binned at its last stored step instead.
+
+            trajDF (pandas.DataFrame) kinematics.Fragment.trajDF
+            mass (float) fragment mass in kg
+        """
+        if len(trajDF) == 0:
+            return
+        traj = trajDF[['x', 'y', 'z', 'vx', 'vy', 'vz']].to_numpy(dtype=np.float64)
+        z = traj[:, 2]
+
+        crossing = np.nonzero((z[:-1] > ground_z) & (z[1:] <= ground_z))[0]
+        if len(crossing):
+            i = crossing[0]
+            frac = (z[i] - ground_z) / (z[i] - z[i + 1])
+            impact = traj[i] + frac * (traj[i + 1] - traj[i])
+        else:
+            impact = traj[-1]
+
+        x, y, _, vx, vy, vz = impact
+        self.add(x, y, 0.5 * mass * (vx ** 2 + vy ** 2 + vz ** 2))
+
+
+    def add_fragment(self, fragment):
+        """Bins the impact of a kinematics.Fragment that has run its 3dof.
+        """
+        self.add_trajectory(fragment.trajDF, fragment.mass)
+
+
+    def merge(self, other):
+        """Adds the impacts of another grid with the same geometry in place.
+        """
+        if (self.x_min, self.y_min, self.cell_size, self.shape) != \
+                (other.x_min, other.y_min, other.cell_size, other.shape):
+            raise ValueError('Expected {0} and {1} to have the same grid '
+                             'geometry.'.format(self, other))
+
+        self.counts += other.counts
+        self.energy_sum += other.energy_sum
+        np.maximum(self.energy_max, other.energy_max, out=self.energy_max)
+        self.dropped += other.dropped
+
+
+    def empty_like(self):
+        """Returns an empty grid with the same geometry, i.e. for a worker to
+            fill and merge back.
+        """
+        return FootprintGrid(self.x_min, self.y_min, self.cell_size, self.shape)
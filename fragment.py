@@ -5,6 +5,7 @@ from math import sqrt
 from measures.api import Angle, Mass, Measure, Speed 
 from kinematics.utils import Point, Velocity, State, CartesianFrame, BaseFrame 
 from kinematics.three_dof import Traj3DOF
+from kinematics.storage import pack
 
 
 class Fragment:    
@@ -163,3 +164,12 @@ class Fragment:
         # Append the single row dataframe into the uncompressed container
         self.trajDF = pd.concat([self.trajDF, tmp], ignore_index=True)
 
+
+    def packed_trajectory(self, precision='float32', resolution=None):
+        """Returns the trajectory as a kinematics.storage.PackedTrajectory.  
+            Positions are stored relative to the launch point.  
+        """
+        return pack(self.trajDF[self.colNames].to_numpy(dtype=float), 
+                    self.colNames, precision=precision, 
+                    origin=(self.init_x, self.init_y, self.init_z), 
+                    resolution=resolution)
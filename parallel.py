@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from kinematics.fragment import Fragment
+from kinematics.storage import PRECISIONS, PackedTrajectory
+
+
+def run_trajectories(fragment_kwargs, dt=0.001, lowerKineticLimit=100,
+                     lowerVelLimit=0, processes=None, chunksize=16,
+                     precision='float64', resolution=None):
+    """Runs the 3dof for many fragments in worker processes.
+
+        Workers write their trajectory columns into shared memory blocks and
+        hand back only (block, offset, rows) records, so no DataFrame is
+        pickled back to the parent.
+
+        fragment_kwargs (list(dict))
+            Keyword arguments for kinematics.Fragment, one dict per fragment.
+            Fragments are constructed inside the workers.
+
+        chunksize (int)
+            Number of fragments run by a worker per shared memory block.
+
+        precision (str), resolution (dict)
+            Storage precision of the returned trajectories, see
+            kinematics.storage.pack.  The 3dof itself always runs in float64.
+
+        Returns TrajectoryResults.  Call close() (or use it as a context
+        manager) to release the shared memory.
+    """
+    fragment_kwargs = list(fragment_kwargs)
+    if precision not in PRECISIONS:
+        raise ValueError('Expected input precision to be one of {0}.'
+                         .format(list(PRECISIONS)))
+
+    tasks = [(fragment_kwargs[i:i + chunksize], dt, lowerKineticLimit,
+              lowerVelLimit, precision, resolution)
+             for i in range(0, len(fragment_kwargs), chunksize)]
+
+    with Pool(processes) as pool:
+        chunks = pool.map(_run_chunk, tasks)
+
+    # Workers return failures as values so every block that was written is
+    # known here and can be unlinked before re-raising.
+    failures = [c for c in chunks if isinstance(c, Exception)]
+    if failures:
+        for chunk in chunks:
+            if not isinstance(chunk, Exception):
+                block = SharedMemory(name=chunk[0])
+                block.close()
+                block.unlink()
+        raise failures[0]
+
+    return TrajectoryResults(chunks, precision)
+
+
+
+class TrajectoryResults:
+    """Trajectories stored in shared memory blocks written by worker
+        processes.  Trajectories are copied out of the blocks when accessed,
+        unless a view is asked for explicitly.
+
+        Attributes:
+            columns (list(str))
+                Trajectory column names, same as Fragment.colNames
+            precision (str)
+                Storage precision, see kinematics.storage
+            records (list(tuple))
+                (block name, byte offset, rows, column offset) for every
+                fragment, in the order the fragments were submitted
+    """
+
+    def __init__(self, chunks, precision='float64'):
+        self.columns = []
+        self.precision = precision
+        self.records = []
+        self._scale = None
+        self._blocks = {}
+
+        for name, columns, scale, records in chunks:
+            self.columns = columns
+            self._scale = scale
+            self._blocks[name] = SharedMemory(name=name)
+            self.records.extend((name, offset, rows, column_offset)
+                                for offset, rows, column_offset in records)
+
+
+    def __len__(self):
+        return len(self.records)
+
+
+    def __getitem__(self, key):
+        """Returns the trajectory of fragment key as a new float64 DataFrame.
+            It stays valid after close().
+        """
+        return pd.DataFrame(self.array(key), columns=self.columns, copy=False)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def array(self, key, copy=True):
+        """Returns the trajectory of fragment key as a (rows, columns) float64
+            array.
+
+            copy (bool)
+                If False and the precision is float64, returns a view of the
+                shared memory instead.  The view must not be used after
+                close(), reading it then crashes the process.  Reduced
+                precisions are always unpacked into a new array.
+        """
+        packed = self.packed(key, copy=False)
+        if self.precision == 'float64':
+            return packed.data.copy() if copy else packed.data
+        return packed.unpack()
+
+
+    def packed(self, key, copy=True):
+        """Returns the trajectory of fragment key as a PackedTrajectory.
+
+            copy (bool)
+                If False, the PackedTrajectory views the shared memory and
+                must not be used after close().
+        """
+        name, offset, rows, column_offset = self.records[key]
+        data = np.ndarray((rows, len(self.columns)),
+                          dtype=PRECISIONS[self.precision],
+                          buffer=self._blocks[name].buf, offset=offset)
+        return PackedTrajectory(data.copy() if copy else data, self.columns,
+                                self.precision, column_offset, self._scale)
+
+
+    def close(self):
+        """Releases and unlinks every shared memory block.  Views handed out
+            by array(copy=False) or packed(copy=False) are no longer valid.
+        """
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks = {}
+        self.records = []
+
+
+
+def _run_chunk(task):
+    """Worker entry point.  Runs a chunk of fragments and copies their
+        trajectories back to back into a single new shared memory block.
+        Returns the raised exception instead if anything fails, after
+        unlinking the block.
+    """
+    (fragment_kwargs, dt, lowerKineticLimit, lowerVelLimit, precision,
+     resolution) = task
+
+    try:
+        packed = []
+        for kwargs in fragment_kwargs:
+            fragment = Fragment(**kwargs)
+            fragment.run_3dof(dt=dt, lowerKineticLimit=lowerKineticLimit,
+                              lowerVelLimit=lowerVelLimit)
+            packed.append(fragment.packed_trajectory(precision, resolution))
+    except Exception as e:
+        return e
+
+    size = sum(p.nbytes for p in packed)
+    block = SharedMemory(create=True, size=max(size, 1))
+
+    records = []
+    offset = 0
+    try:
+        for p in packed:
+            np.ndarray(p.data.shape, dtype=p.data.dtype, buffer=block.buf,
+                       offset=offset)[:] = p.data
+            records.append((offset, len(p), p.offset))
+            offset += p.nbytes
+    except Exception as e:
+        block.close()
+        block.unlink()
+        return e
+
+    # Leave the block alive for the parent, which takes over ownership and
+    # unlinks it on close().  Stop this process's resource tracker from
+    # unlinking it first.
+    name = block.name
+    block.close()
+    resource_tracker.unregister(block._name, 'shared_memory')
+    columns = packed[0].columns if packed else []
+    scale = packed[0].scale if packed else None
+    return name, columns, scale, records
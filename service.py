@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import hashlib
+import json
+import math
+import numbers
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from kinematics.fragment import Fragment
+
+
+class SimulationService:
+    """Local asyncio service that runs 3dof trajectory requests on a worker
+        pool.
+
+        Identical requests are recognized by a content hash of the Fragment
+        arguments, the drag file contents and the run_3dof arguments.
+        Identical requests that are in flight share one computation, finished
+        ones are memoized with LRU eviction, and new requests are collected
+        into batches that are split across the pool's workers.
+
+        Use as an async context manager, or call start() and close().
+
+        Attributes:
+            max_cache (int) number of trajectories kept in the LRU cache
+            batch_size (int) most requests collected into one batch
+            batch_window (float) seconds to wait for a batch to fill
+            workers (int) number of pool processes, and the number of jobs
+                each batch is split into.  Defaults to os.cpu_count().
+    """
+
+    def __init__(self, max_cache=256, batch_size=16, batch_window=0.005,
+                 executor=None, workers=None):
+        self.max_cache = max_cache
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.workers = workers or os.cpu_count() or 1
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._cache = OrderedDict()
+        self._in_flight = {}
+        self._queue = None
+        self._batcher = None
+        self._closing = False
+        self._batches = set()
+        self._drag_hashes = {}
+
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+    async def start(self):
+        if self._batcher is not None:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        self._closing = False
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+
+
+    async def close(self):
+        """Stops accepting requests, waits for running batches and shuts the
+            worker pool down if the service created it.
+        """
+        if self._batcher is None or self._closing:
+            return
+        # Set before the first await so submits that resume while closing
+        # are refused instead of queued where nothing will run them
+        self._closing = True
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._batcher = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+        # Fail whatever never made it out of the queue
+        for future in self._in_flight.values():
+            if not future.done():
+                future.set_exception(RuntimeError('SimulationService closed.'))
+        self._in_flight = {}
+
+        if self._owns_executor:
+            # shutdown() blocks until the workers exit
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._executor.shutdown)
+            self._executor = None
+
+
+    async def submit(self, fragment_kwargs, dt=0.001, lowerKineticLimit=100,
+                     lowerVelLimit=0):
+        """Returns the trajectory of the requested fragment as a new
+            pandas.DataFrame with the same columns as Fragment.trajDF.
+
+            fragment_kwargs (dict)
+                Keyword arguments for kinematics.Fragment
+        """
+        if self._closing:
+            raise RuntimeError('SimulationService closed.')
+        if self._batcher is None:
+            raise RuntimeError('SimulationService has not been started.')
+
+        request = (dict(fragment_kwargs), dt, lowerKineticLimit, lowerVelLimit)
+        key = await self.request_key(*request)
+
+        # close() may have run while the key was computed
+        if self._closing or self._batcher is None:
+            raise RuntimeError('SimulationService closed.')
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            columns, array = self._cache[key]
+        else:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = future
+                self._queue.put_nowait((key, request))
+            columns, array = await asyncio.shield(future)
+
+        # Callers must not be able to mutate the memoized array
+        return pd.DataFrame(array, columns=columns, copy=True)
+
+
+    async def request_key(self, fragment_kwargs, dt, lowerKineticLimit,
+                          lowerVelLimit):
+        """Returns the content hash that identifies a request.  Numbers are
+            compared as floats, so posX=1 and posX=1.0 are the same request.
+        """
+        # Reading the drag file can block, keep it off the event loop
+        drag = await asyncio.get_running_loop().run_in_executor(
+            None, self._drag_hash, fragment_kwargs.get('dragFile', ''))
+
+        content = {'fragment': _normalize(fragment_kwargs),
+                   'drag': drag,
+                   'dt': _normalize(dt),
+                   'lowerKineticLimit': _normalize(lowerKineticLimit),
+                   'lowerVelLimit': _normalize(lowerVelLimit)}
+        text = json.dumps(content, sort_keys=True, default=repr)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+    def cache_info(self):
+        return {'cached': len(self._cache),
+                'in_flight': len(self._in_flight),
+                'max_cache': self.max_cache}
+
+
+    def _drag_hash(self, path):
+        """Hash of the drag file contents.  Re-read only when the file's size
+            or modification time changes.
+        """
+        if not path or not os.path.isfile(path):
+            return ''
+        stat = os.stat(path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        cached = self._drag_hashes.get(path)
+        if cached is None or cached[0] != stamp:
+            with open(path, 'rb') as f:
+                cached = (stamp, hashlib.sha256(f.read()).hexdigest())
+            self._drag_hashes[path] = cached
+        return cached[1]
+
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(),
+                                                        timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Don't wait on the pool here so further batches keep it busy
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        requests = [request for _, request in batch]
+
+        # One job per worker so a batch uses the whole pool.  Batching only
+        # saves per-job overhead when there are more requests than workers.
+        size = math.ceil(len(requests) / self.workers)
+        parts = [requests[i:i + size] for i in range(0, len(requests), size)]
+        jobs = [loop.run_in_executor(self._executor, _run_requests, part)
+                for part in parts]
+
+        results = []
+        for part, outcome in zip(parts, await asyncio.gather(
+                *jobs, return_exceptions=True)):
+            if isinstance(outcome, Exception):
+                outcome = len(part) * [outcome]
+            results.extend(outcome)
+
+        for (key, _), result in zip(batch, results):
+            future = self._in_flight.pop(key, None)
+            if isinstance(result, Exception):
+                if future is not None and not future.done():
+                    future.set_exception(result)
+                continue
+
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache:
+                self._cache.popitem(last=False)
+
+            if future is not None and not future.done():
+                future.set_result(result)
+
+
+    async def serve_unix(self, path):
+        """Serves requests over a unix socket until cancelled.
+
+            Each request is one line of JSON
+                {"fragment": {...}, "dt": 0.001, "lowerKineticLimit": 100,
+                 "lowerVelLimit": 0}
+            and is answered by one line of JSON
+                {"columns": [...], "data": [[...], ...]} or {"error": "..."}
+        """
+        server = await asyncio.start_unix_server(self._handle_client, path=path)
+        async with server:
+            await server.serve_forever()
+
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    traj = await self.submit(
+                        message['fragment'],
+                        dt=message.get('dt', 0.001),
+                        lowerKineticLimit=message.get('lowerKineticLimit', 100),
+                        lowerVelLimit=message.get('lowerVelLimit', 0))
+                    reply = {'columns': list(traj.columns),
+                             'data': traj.to_numpy().tolist()}
+                except Exception as e:
+                    reply = {'error': '{0}: {1}'.format(e.__class__.__name__, e)}
+                writer.write(json.dumps(reply).encode('utf-8') + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+
+def _normalize(value):
+    """Returns value with every number as a float, for hashing.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+
+def _run_requests(requests):
+    """Worker entry point.  Runs a batch of requests and returns a
+        (columns, float64 array) tuple or the raised exception for each.
+    """
+    results = []
+    for fragment_kwargs, dt, lowerKineticLimit, lowerVelLimit in requests:
+        try:
+            fragment = Fragment(**fragment_kwargs)
+            fragment.run_3dof(dt=dt, lowerKineticLimit=lowerKineticLimit,
+                              lowerVelLimit=lowerVelLimit)
+            columns = fragment.colNames
+            results.append((columns,
+                            fragment.trajDF[columns].to_numpy(dtype=np.float64)))
+        except Exception as e:
+            results.append(e)
+    return results
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+# Columns expected in a polar zone table.  Angles in radians, velocity in
+# m/s and mass in kg.  velocity_std is optional and defaults to 0.
+ZONE_COLUMNS = ['count',
+                'azi_min',
+                'azi_max',
+                'elv_min',
+                'elv_max',
+                'velocity',
+                'mott_mass']
+
+
+def spawn_from_polar_zones(zones, posX=0, posY=0, posZ=0, seed=None):
+    """Samples the initial states of every fragment described by a polar
+        zone table straight into arrays, without constructing Fragment
+        objects or their 3dof.
+
+        Directions are uniform in solid angle within each zone's azimuth and
+        elevation bounds.  Masses follow the Mott distribution
+        N(>m) = N0 exp(-sqrt(m / mott_mass)).
+
+        Limitation: there is no array-level 3dof engine yet.  Running the
+        sampled fragments still goes through fragment_kwargs and
+        run_trajectories, which builds one Fragment (with its full Traj3DOF
+        read and setup) per sample.  Sampling itself is fully vectorized.
+
+        zones (pandas.DataFrame or dict of array-like)
+            One row per polar zone with the columns in ZONE_COLUMNS, plus an
+            optional velocity_std column.
+
+        posX, posY, posZ (float)
+            Detonation point in meters.  Shared by every fragment.
+
+        seed (int or numpy.random.Generator)
+
+        Returns dict of numpy.ndarray, all of shape (N,), with keys
+            x, y, z, vx, vy, vz, azi, elv, velocity, mass, zone.
+            zone is the row index of the polar zone each fragment came from.
+    """
+    missing = [c for c in ZONE_COLUMNS if c not in zones]
+    if missing:
+        raise ValueError('Polar zone table is missing columns {0}.'
+                         .format(missing))
+
+    rng = np.random.default_rng(seed)
+
+    count = np.asarray(zones['count'], dtype=np.int64)
+    if np.any(count < 0):
+        raise ValueError('Expected every polar zone count to be >= 0.')
+
+    # Expand the per-zone parameters to one entry per fragment
+    zone = np.repeat(np.arange(len(count)), count)
+    n = len(zone)
+
+    def column(name, default=None):
+        if name not in zones and default is not None:
+            return np.full(n, default, dtype=np.float64)
+        return np.asarray(zones[name], dtype=np.float64)[zone]
+
+    azi = rng.uniform(column('azi_min'), column('azi_max'))
+
+    # Uniform in solid angle means uniform in sin(elevation)
+    sin_elv = rng.uniform(np.sin(column('elv_min')), np.sin(column('elv_max')))
+    elv = np.arcsin(sin_elv)
+
+    velocity = column('velocity') \
+        + column('velocity_std', 0) * rng.standard_normal(n)
+    velocity = np.maximum(velocity, 0)
+
+    mass = column('mott_mass') * rng.standard_exponential(n) ** 2
+
+    cos_elv = np.cos(elv)
+    return {'x': np.full(n, posX, dtype=np.float64),
+            'y': np.full(n, posY, dtype=np.float64),
+            'z': np.full(n, posZ, dtype=np.float64),
+            'vx': velocity * cos_elv * np.cos(azi),
+            'vy': velocity * cos_elv * np.sin(azi),
+            'vz': velocity * sin_elv,
+            'azi': azi,
+            'elv': elv,
+            'velocity': velocity,
+            'mass': mass,
+            'zone': zone}
+
+
+
+def fragment_kwargs(batch, **kwargs):
+    """Yields kinematics.Fragment keyword arguments for every fragment in a
+        spawned batch, i.e. for kinematics.run_trajectories.  Extra keyword
+        arguments (dragFile, presentedArea, ...) are passed to every fragment.
+
+        Each set of arguments becomes a full Fragment and Traj3DOF in the
+        worker.  Use it to run spawned batches until the 3dof grows an
+        array-level entry point, not as a replacement for one.
+    """
+    for i in range(len(batch['mass'])):
+        yield dict(kwargs,
+                   posX=float(batch['x'][i]),
+                   posY=float(batch['y'][i]),
+                   posZ=float(batch['z'][i]),
+                   initVelocity=float(batch['velocity'][i]),
+                   azimuth=float(batch['azi'][i]),
+                   elevation=float(batch['elv'][i]),
+                   mass=float(batch['mass'][i]))
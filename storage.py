@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+
+# Storage dtype for each precision mode.  Integration always runs in
+# float64; these only apply to stored trajectories and batch arrays.
+PRECISIONS = {'float64': np.float64,
+              'float32': np.float32,
+              'quantized': np.int32}
+
+# Quantization step for each known column in the quantized mode.
+# Positions to 1 cm, velocities to 1 mm/s, time to 0.1 ms.  int32 then
+# covers +/-21,000 km of position relative to the origin and about 2.4 days
+# of flight time.
+DEFAULT_RESOLUTION = {'t': 1e-4,
+                      'x': 0.01,
+                      'y': 0.01,
+                      'z': 0.01,
+                      'vx': 0.001,
+                      'vy': 0.001,
+                      'vz': 0.001,
+                      'azi': 1e-7,
+                      'elv': 1e-7,
+                      'velocity': 0.001,
+                      'mass': 1e-7}
+
+# Columns stored relative to the per-fragment origin
+POSITION_COLUMNS = ['x', 'y', 'z']
+
+
+class PackedTrajectory:
+    """A trajectory (or any table of named float columns) stored at reduced
+        precision.  Each column is stored as (value - offset) / scale in a
+        single (rows, columns) array of the precision's dtype.
+
+        Attributes:
+            data (numpy.ndarray) shape (rows, columns)
+            columns (list(str))
+            precision (str) one of PRECISIONS
+            offset (numpy.ndarray) shape (columns,)
+                Launch point for position columns, 0 elsewhere and for the
+                float64 precision
+            scale (numpy.ndarray) shape (columns,)
+                Quantization step, 1 unless precision is quantized
+    """
+
+    def __init__(self, data, columns, precision, offset, scale):
+        if precision not in PRECISIONS:
+            raise ValueError('Expected input precision to be one of {0}.'
+                             .format(list(PRECISIONS)))
+
+        self.data = data
+        self.columns = list(columns)
+        self.precision = precision
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+
+
+    def __len__(self):
+        return len(self.data)
+
+
+    def __repr__(self):
+        return "{0}({1}, rows={2}, columns={3})".format(self.__class__.__name__,
+                                                        self.precision,
+                                                        len(self),
+                                                        self.columns)
+
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+
+    def unpack(self):
+        """Returns the stored values as a float64 (rows, columns) array.
+        """
+        return self.data.astype(np.float64) * self.scale + self.offset
+
+
+    def to_dataframe(self):
+        """Returns the stored values as a float64 pandas.DataFrame.
+        """
+        return pd.DataFrame(self.unpack(), columns=self.columns)
+
+
+
+def pack(array, columns, precision='float32', origin=None, resolution=None):
+    """Packs a float table into a PackedTrajectory.
+
+        array (numpy.ndarray) shape (rows, columns)
+
+        columns (list(str))
+
+        precision (str)
+            float64, float32, or quantized (int32 offset-plus-scale)
+
+        origin (array-like of 3 floats)
+            Offset subtracted from the x, y, z columns in the reduced
+            precision modes.  Defaults to the first row, i.e. the launch
+            point of a trajectory.  float64 always stores absolute values.
+
+        resolution (dict)
+            Per-column quantization steps that override DEFAULT_RESOLUTION.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError('Expected input precision to be one of {0}.'
+                         .format(list(PRECISIONS)))
+
+    array = np.asarray(array, dtype=np.float64).reshape(-1, len(columns))
+    columns = list(columns)
+
+    offset = np.zeros(len(columns))
+    if len(array) and precision != 'float64':
+        if origin is not None:
+            origin = np.asarray(origin, dtype=np.float64)
+        for axis, c in enumerate(POSITION_COLUMNS):
+            if c in columns:
+                i = columns.index(c)
+                offset[i] = array[0, i] if origin is None else origin[axis]
+
+    scale = np.ones(len(columns))
+    if precision == 'quantized':
+        steps = dict(DEFAULT_RESOLUTION, **(resolution or {}))
+        missing = [c for c in columns if c not in steps]
+        if missing:
+            raise ValueError('No quantization resolution for columns {0}.'
+                             .format(missing))
+        scale = np.array([steps[c] for c in columns], dtype=np.float64)
+
+    data = np.rint((array - offset) / scale) if precision == 'quantized' \
+        else array - offset
+
+    if precision == 'quantized':
+        # NaN and inf have no integer representation
+        if not np.all(np.isfinite(data)):
+            raise ValueError('Cannot quantize non-finite values.')
+        info = np.iinfo(np.int32)
+        if data.size and (data.min() < info.min or data.max() > info.max):
+            raise ValueError('Values are out of the int32 range at the '
+                             'requested resolution.')
+
+    return PackedTrajectory(data.astype(PRECISIONS[precision]), columns,
+                            precision, offset, scale)
+
+
+
+def pack_batch(batch, precision='float32', columns=None, resolution=None):
+    """Packs a dict of (N,) float arrays, i.e. the output of
+        kinematics.spawn_from_polar_zones, into a PackedTrajectory.
+        x, y, z are stored relative to the first fragment's position.
+
+        columns (list(str))
+            Keys to pack.  Defaults to every key with a known resolution.
+    """
+    if columns is None:
+        columns = [c for c in batch if c in DEFAULT_RESOLUTION]
+    array = np.column_stack([np.asarray(batch[c], dtype=np.float64)
+                             for c in columns])
+    return pack(array, columns, precision=precision, resolution=resolution)
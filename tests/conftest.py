@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Makes the repository importable as the kinematics package.
+
+    The checkout may be under any directory name, so the package is
+    registered from this repository's path.  kinematics/__init__.py pulls in
+    the 3dof engine (kinematics.three_dof) and kinematics.munition, which are
+    not part of this repository.  When they are not installed the package is
+    registered without running __init__.py, so modules that don't need the
+    engine can still be tested.
+
+    pytest would also collect the repository root as a package, and import
+    its __init__.py, because the root has one.  RootCollector collects it as
+    a plain directory instead.
+
+    Test modules import what they need with pytest.importorskip and are
+    skipped when a dependency (the engine, measures, numpy-quaternion, ...)
+    is missing.
+"""
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _register_package():
+    if 'kinematics' in sys.modules:
+        return
+
+    spec = importlib.util.spec_from_file_location(
+        'kinematics', os.path.join(ROOT, '__init__.py'),
+        submodule_search_locations=[ROOT])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules['kinematics'] = package
+    try:
+        spec.loader.exec_module(package)
+        return
+    except ImportError:
+        # Drop the partial import, including any submodules it loaded
+        for name in [n for n in sys.modules
+                     if n == 'kinematics' or n.startswith('kinematics.')]:
+            del sys.modules[name]
+
+    package = types.ModuleType('kinematics')
+    package.__path__ = [ROOT]
+    sys.modules['kinematics'] = package
+
+
+class RootCollector:
+    """Global plugin: collects the repository root as a plain directory
+        instead of a package.  A conftest's own collection hooks only
+        apply below its directory, so this is registered as a plugin.
+    """
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collect_directory(self, path, parent):
+        if Path(path) == Path(ROOT):
+            return pytest.Dir.from_parent(parent, path=Path(path))
+        return None
+
+
+
+_register_package()
+
+# pytest.Dir and the pytest_collect_directory hook are new in pytest 8
+if hasattr(pytest, 'Dir'):
+    def pytest_configure(config):
+        if not config.pluginmanager.has_plugin('kinematics-root'):
+            config.pluginmanager.register(RootCollector(), 'kinematics-root')
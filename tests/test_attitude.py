@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+quaternion = pytest.importorskip('quaternion')
+attitude = pytest.importorskip('kinematics.utils.attitude')
+Attitude = attitude.Attitude
+interpolate_attitude = attitude.interpolate_attitude
+
+
+def about_z(angle):
+    return quaternion.from_rotation_vector([0, 0, angle])
+
+
+def angle_about_z(att):
+    x = att.rotate([1, 0, 0])
+    return np.arctan2(x[:, 1], x[:, 0])
+
+
+def test_slerp_midpoint():
+    a = Attitude(np.array([about_z(0), about_z(0.2)]))
+    b = Attitude(np.array([about_z(1.0), about_z(-0.6)]))
+
+    np.testing.assert_allclose(angle_about_z(a.slerp(b, 0.5)), [0.5, -0.2],
+                               atol=1e-12)
+    np.testing.assert_allclose(angle_about_z(a.slerp(b, 0)), [0, 0.2],
+                               atol=1e-12)
+    np.testing.assert_allclose(angle_about_z(a.slerp(b, 1)), [1.0, -0.6],
+                               atol=1e-12)
+
+
+def test_slerp_takes_shortest_arc():
+    # -q is the same rotation as q, so the dot product is negative and the
+    # long way round would pass through a half turn
+    a = Attitude(about_z(0.1))
+    b = Attitude(-about_z(0.3))
+    assert np.sum(quaternion.as_float_array(a.orientation) *
+                  quaternion.as_float_array(b.orientation)) < 0
+
+    np.testing.assert_allclose(angle_about_z(a.slerp(b, 0.5)), [0.2],
+                               atol=1e-12)
+
+    # Across +/-pi the shortest arc wraps instead of crossing zero
+    a = Attitude(about_z(np.pi - 0.1))
+    b = Attitude(about_z(-np.pi + 0.1))
+    mid = angle_about_z(a.slerp(b, 0.5))
+    np.testing.assert_allclose(np.abs(mid), [np.pi], atol=1e-12)
+
+
+def test_slerp_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        Attitude.identity(2).slerp(Attitude.identity(3), 0.5)
+
+
+def test_propagate_constant_body_rate():
+    rate = 0.3
+    att = Attitude.identity(2)
+    for _ in range(100):
+        att = att.propagate([[0, 0, rate], [rate, 0, 0]], 0.01)
+
+    # 100 steps of 0.01 s at 0.3 rad/s turn each body 0.3 rad
+    np.testing.assert_allclose(att.rotate([1, 0, 0])[0],
+                               [np.cos(0.3), np.sin(0.3), 0], atol=1e-12)
+    np.testing.assert_allclose(att.rotate([0, 1, 0])[1],
+                               [0, np.cos(0.3), np.sin(0.3)], atol=1e-12)
+    np.testing.assert_allclose(np.abs(att.orientation), 1, atol=1e-12)
+
+
+def test_propagate_uses_body_axes():
+    # Pitched up a quarter turn about y, a body z spin turns about the
+    # reference x axis
+    att = Attitude(quaternion.from_rotation_vector([0, np.pi / 2, 0]))
+    spun = att.propagate([0, 0, 0.5], 1.0)
+
+    expected = quaternion.from_rotation_vector([0.5, 0, 0]) * att.orientation
+    np.testing.assert_allclose(quaternion.as_rotation_matrix(spun.orientation),
+                               quaternion.as_rotation_matrix(expected),
+                               atol=1e-12)
+
+
+def test_propagate_does_not_mutate():
+    att = Attitude.identity(1)
+    att.propagate([0, 0, 1], 1.0)
+    assert att.orientation[0] == quaternion.one
+
+
+def test_rotate_inverse_rotate_round_trip():
+    rng = np.random.default_rng(0)
+    att = Attitude.from_euler_angles(rng.uniform(-np.pi, np.pi, (50, 3)))
+    vectors = rng.normal(size=(50, 3))
+
+    np.testing.assert_allclose(att.inverse_rotate(att.rotate(vectors)),
+                               vectors, atol=1e-12)
+    np.testing.assert_allclose(att.rotate(att.inverse_rotate(vectors)),
+                               vectors, atol=1e-12)
+    np.testing.assert_allclose(np.linalg.norm(att.rotate(vectors), axis=1),
+                               np.linalg.norm(vectors, axis=1))
+
+
+def test_interpolate_attitude_between_samples():
+    samples = [Attitude(about_z(a)) for a in (0, 0.4, 1.0)]
+    att = interpolate_attitude([0, 1, 3], samples, 2.0)
+    np.testing.assert_allclose(angle_about_z(att), [0.7], atol=1e-12)
+
+
+def test_interpolate_attitude_clamps():
+    samples = [Attitude(about_z(a)) for a in (0, 0.4, 1.0)]
+    np.testing.assert_allclose(
+        angle_about_z(interpolate_attitude([0, 1, 3], samples, -5)), [0],
+        atol=1e-12)
+    np.testing.assert_allclose(
+        angle_about_z(interpolate_attitude([0, 1, 3], samples, 10)), [1.0],
+        atol=1e-12)
+
+
+def test_interpolate_attitude_single_sample():
+    sample = Attitude(about_z(0.4))
+    att = interpolate_attitude([2.0], [sample], 7.0)
+    np.testing.assert_allclose(angle_about_z(att), [0.4], atol=1e-12)
+    assert att is not sample
+
+
+def test_interpolate_attitude_sample_count_mismatch():
+    with pytest.raises(ValueError):
+        interpolate_attitude([0, 1], [Attitude.identity(1)], 0.5)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+closest_approach_arrays = pytest.importorskip(
+    'kinematics.closest_approach').closest_approach_arrays
+
+
+def brute_force(t, xyz, assets):
+    """Exact closest approach, segment by segment, without any pruning."""
+    dist = np.full(len(assets), np.inf)
+    time = np.full(len(assets), np.nan)
+    for k, a in enumerate(assets):
+        for i in range(max(len(t) - 1, 1)):
+            p0 = xyz[i]
+            p1 = xyz[min(i + 1, len(t) - 1)]
+            seg = p1 - p0
+            len2 = seg @ seg
+            frac = 0.0 if len2 == 0 else np.clip((a - p0) @ seg / len2, 0, 1)
+            d = np.linalg.norm(a - (p0 + frac * seg))
+            if d < dist[k]:
+                dist[k] = d
+                time[k] = t[i] + frac * (t[min(i + 1, len(t) - 1)] - t[i])
+    return dist, time
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('chunk_size', [1, 7, 256])
+def test_matches_brute_force(seed, chunk_size):
+    rng = np.random.default_rng(seed)
+    m = rng.integers(1, 60)
+    t = np.cumsum(rng.uniform(0.01, 1, m))
+    xyz = np.cumsum(rng.normal(0, 10, (m, 3)), axis=0)
+    # Zero-length segments
+    xyz[rng.integers(0, m, m // 5)] = xyz[0]
+    assets = rng.uniform(-50, 50, (rng.integers(1, 12), 3))
+
+    dist, time = closest_approach_arrays(t, xyz, assets, chunk_size)
+    ref_dist, ref_time = brute_force(t, xyz, assets)
+
+    np.testing.assert_allclose(dist, ref_dist, atol=1e-9)
+    # Closest point may be reached at several times; check the distance at
+    # the reported time instead.
+    pos = np.column_stack([np.interp(time, t, xyz[:, i]) for i in range(3)])
+    np.testing.assert_allclose(np.linalg.norm(pos - assets, axis=1), ref_dist,
+                               atol=1e-6)
+
+
+def test_refines_within_segment():
+    t = np.array([0., 10.])
+    xyz = np.array([[-10., 0., 0.], [10., 0., 0.]])
+    dist, time = closest_approach_arrays(t, xyz, [[0., 3., 4.]])
+    assert dist[0] == pytest.approx(5)
+    assert time[0] == pytest.approx(5)
+
+
+def test_empty_trajectory():
+    dist, time = closest_approach_arrays([], np.empty((0, 3)), [[0, 0, 0]])
+    assert np.isinf(dist[0]) and np.isnan(time[0])
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+FootprintGrid = pytest.importorskip('kinematics.footprint').FootprintGrid
+
+
+def test_add_bins_counts_and_energy():
+    grid = FootprintGrid(0, 0, 10, (3, 4))
+    grid.add([1, 5, 25, -1, 35, 12], [1, 2, 39, 0, 5, 15], [1, 3, 2, 9, 9, 4])
+
+    assert grid.dropped == 2
+    assert grid.counts[0, 0] == 2
+    assert grid.energy_sum[0, 0] == 4
+    assert grid.energy_max[0, 0] == 3
+    assert grid.counts[2, 3] == 1
+    assert grid.counts[1, 1] == 1
+    np.testing.assert_allclose(grid.energy_density, grid.energy_sum / 100)
+
+
+def test_merge_matches_single_grid():
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-5, 55, (2, 1000))
+    energy = rng.uniform(0, 10, 1000)
+
+    whole = FootprintGrid(0, 0, 5, (10, 10))
+    whole.add(x, y, energy)
+
+    merged = whole.empty_like()
+    for part in np.array_split(np.arange(1000), 7):
+        partial = merged.empty_like()
+        partial.add(x[part], y[part], energy[part])
+        merged += partial
+
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    np.testing.assert_allclose(merged.energy_sum, whole.energy_sum)
+    np.testing.assert_array_equal(merged.energy_max, whole.energy_max)
+    assert merged.dropped == whole.dropped
+
+
+def test_merge_rejects_different_geometry():
+    with pytest.raises(ValueError):
+        FootprintGrid(0, 0, 5, (10, 10)).merge(FootprintGrid(0, 0, 5, (10, 9)))
+
+
+def test_add_trajectory_interpolates_ground_crossing():
+    traj = pd.DataFrame({'x': [0., 10., 20.],
+                         'y': [0., 0., 0.],
+                         'z': [10., 2., -6.],
+                         'vx': [3., 3., 3.],
+                         'vy': [0., 0., 0.],
+                         'vz': [0., -4., -4.]})
+    grid = FootprintGrid(0, -5, 1, (30, 10))
+    grid.add_trajectory(traj, mass=2.0)
+
+    # Crosses z=0 a quarter of the way from the second to the third step
+    assert grid.counts[12, 5] == 1
+    assert grid.energy_sum[12, 5] == pytest.approx(0.5 * 2.0 * 25)
+
+
+def test_add_trajectory_without_crossing_uses_last_step():
+    traj = pd.DataFrame({'x': [0., 3.], 'y': [0., 0.], 'z': [100., 90.],
+                         'vx': [1., 1.], 'vy': [0., 0.], 'vz': [0., 0.]})
+    grid = FootprintGrid(0, -5, 1, (10, 10))
+    grid.add_trajectory(traj, mass=4.0)
+    assert grid.counts[3, 5] == 1
+    assert grid.energy_sum[3, 5] == pytest.approx(2.0)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+units = pytest.importorskip('astropy.units')
+measures = pytest.importorskip('measures.api')
+utils = pytest.importorskip('kinematics.utils')
+geodetic_frame = pytest.importorskip('kinematics.utils.geodetic_frame')
+
+Angle, Length = measures.Angle, measures.Length
+BaseFrame, CartesianFrame, Point, Vector3 = (
+    utils.BaseFrame, utils.CartesianFrame, utils.Point, utils.Vector3)
+ECEFFrame, EarthFrame, GeodeticFrame, LocalTangentFrame = (
+    utils.ECEFFrame, utils.EarthFrame, utils.GeodeticFrame,
+    utils.LocalTangentFrame)
+ecef_to_lla, lla_to_ecef, transform_coords = (
+    utils.ecef_to_lla, utils.lla_to_ecef, utils.transform_coords)
+WGS84_A, WGS84_B = geodetic_frame.WGS84_A, geodetic_frame.WGS84_B
+
+
+def test_lla_ecef_round_trip():
+    rng = np.random.default_rng(0)
+    lla = np.column_stack((np.radians(rng.uniform(-90, 90, 10000)),
+                           np.radians(rng.uniform(-180, 180, 10000)),
+                           rng.uniform(-500, 100000, 10000)))
+    back = ecef_to_lla(lla_to_ecef(lla))
+
+    np.testing.assert_allclose(back[:, :2], lla[:, :2], atol=1e-12)
+    np.testing.assert_allclose(back[:, 2], lla[:, 2], atol=1e-6)
+
+
+@pytest.mark.parametrize('sign', [1, -1])
+@pytest.mark.parametrize('alt', [0, 1000, 400000])
+def test_poles(sign, alt):
+    ecef = lla_to_ecef([sign * np.pi / 2, 0.3, alt])[0]
+    np.testing.assert_allclose(ecef, [0, 0, sign * (WGS84_B + alt)], atol=1e-6)
+
+    lat, _, back_alt = ecef_to_lla(ecef)[0]
+    assert lat == pytest.approx(sign * np.pi / 2, abs=1e-12)
+    assert back_alt == pytest.approx(alt, abs=1e-6)
+
+
+def test_equator_prime_meridian():
+    np.testing.assert_allclose(lla_to_ecef([0, 0, 0])[0], [WGS84_A, 0, 0])
+
+
+def test_local_tangent_frame_axes():
+    lat, lon = np.radians(45), np.radians(10)
+    enu = LocalTangentFrame(Angle(lat, units.rad), Angle(lon, units.rad),
+                            Length(100, units.m))
+    ned = LocalTangentFrame(Angle(lat, units.rad), Angle(lon, units.rad),
+                            Length(100, units.m), axes_convention='NED')
+
+    above = lla_to_ecef([lat, lon, 200])
+    np.testing.assert_allclose(transform_coords(above, ECEFFrame(), enu),
+                               [[0, 0, 100]], atol=1e-6)
+    np.testing.assert_allclose(transform_coords(above, ECEFFrame(), ned),
+                               [[0, 0, -100]], atol=1e-6)
+    np.testing.assert_allclose(transform_coords([[1, 2, 3]], ned, enu),
+                               [[2, 1, -3]], atol=1e-9)
+
+
+def test_earth_frame_is_abstract():
+    with pytest.raises(TypeError):
+        EarthFrame()
+
+
+def test_point_between_anchored_cartesian_and_geodetic():
+    site = LocalTangentFrame(Angle(30, units.deg), Angle(-100, units.deg),
+                             Length(50, units.m))
+    world = BaseFrame(anchor=site)
+    enu = CartesianFrame(base_frame=world, axes_convention='ENU')
+    lla = GeodeticFrame()
+
+    p = Point([0, 0, 10], frame=enu).to_frame(lla)
+    lat, lon, alt = p.to_units_array()
+    assert lat.to(units.deg).value == pytest.approx(30)
+    assert lon.to(units.deg).value == pytest.approx(-100)
+    assert alt.to(units.m).value == pytest.approx(60, abs=1e-6)
+
+    back = p.to_frame(enu)
+    np.testing.assert_allclose(back.coords, [0, 0, 10], atol=1e-6)
+
+
+def test_point_in_translated_and_rotated_frame_round_trip():
+    site = LocalTangentFrame(Angle(30, units.deg), Angle(-100, units.deg),
+                             Length(50, units.m))
+    world = BaseFrame(anchor=site)
+    moved = CartesianFrame(base_frame=world, translation=Vector3([100, 0, 0]))
+    lla = GeodeticFrame()
+
+    # The frame's origin sits at site (0, 0, 0), which is its own (100, 0, 0)
+    p = Point([100, 0, 0], frame=moved).to_frame(lla)
+    lat, lon, alt = p.to_units_array()
+    assert lat.to(units.deg).value == pytest.approx(30)
+    assert lon.to(units.deg).value == pytest.approx(-100)
+    assert alt.to(units.m).value == pytest.approx(50, abs=1e-6)
+
+    back = Point([0, 0, 0], frame=moved).to_frame(lla).to_frame(moved)
+    np.testing.assert_allclose(back.coords, [0, 0, 0], atol=1e-6)
+
+    turned = CartesianFrame(base_frame=world, translation=Vector3([5, -7, 2]),
+                            orientation=(Angle(30, units.deg),
+                                         Angle(20, units.deg),
+                                         Angle(-45, units.deg)))
+    for frame in (turned, CartesianFrame(base_frame=world,
+                                         axes_convention='NED')):
+        back = Point([12, 34, -5], frame=frame).to_frame(ECEFFrame()) \
+            .to_frame(frame)
+        np.testing.assert_allclose(back.coords, [12, 34, -5], atol=1e-6)
+
+
+def test_point_in_unanchored_frame_raises():
+    enu = CartesianFrame(base_frame=BaseFrame(), axes_convention='ENU')
+    with pytest.raises(TypeError, match='not anchored'):
+        Point([0, 0, 0], frame=enu).to_frame(ECEFFrame())
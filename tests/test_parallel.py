@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import glob
+import multiprocessing
+import numpy as np
+import pytest
+parallel = pytest.importorskip('kinematics.parallel')
+from kinematics.storage import pack
+
+# The fake Fragment below is patched into the parent and only reaches the
+# workers when they are forked
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                                reason='needs the fork start method')
+
+COLUMNS = ['t', 'x', 'y', 'z', 'vx', 'vy', 'vz', 'azi', 'elv']
+
+
+class FakeFragment:
+    """Stands in for kinematics.Fragment.  Its trajectory is a function of
+        the constructor arguments, so results can be checked exactly.
+    """
+
+    def __init__(self, posX=0, rows=3, fail=False):
+        self.posX = posX
+        self.rows = rows
+        self.fail = fail
+
+
+    def run_3dof(self, dt=0.001, lowerKineticLimit=100, lowerVelLimit=0):
+        if self.fail:
+            raise RuntimeError('fragment {0} failed'.format(self.posX))
+
+
+    def trajectory(self):
+        traj = np.zeros((self.rows, len(COLUMNS)))
+        traj[:, 0] = np.arange(self.rows)
+        traj[:, 1] = self.posX + np.arange(self.rows)
+        traj[:, 3] = -0.5 * np.arange(self.rows)
+        return traj
+
+
+    def packed_trajectory(self, precision='float32', resolution=None):
+        return pack(self.trajectory(), COLUMNS, precision=precision,
+                    origin=(self.posX, 0, 0), resolution=resolution)
+
+
+def shm_blocks():
+    return set(glob.glob('/dev/shm/psm_*'))
+
+
+@pytest.fixture(autouse=True)
+def fake_fragment(monkeypatch):
+    monkeypatch.setattr(parallel, 'Fragment', FakeFragment)
+
+
+@pytest.mark.parametrize('precision', ['float64', 'float32', 'quantized'])
+def test_round_trip_in_submission_order(precision):
+    kwargs = [{'posX': 100.0 * i, 'rows': 2 + i % 4} for i in range(11)]
+
+    with parallel.run_trajectories(kwargs, processes=3, chunksize=2,
+                                   precision=precision) as results:
+        assert len(results) == len(kwargs)
+        for i, k in enumerate(kwargs):
+            expected = FakeFragment(**k).trajectory()
+            np.testing.assert_allclose(results.array(i), expected, atol=1e-6)
+            assert list(results[i].columns) == COLUMNS
+            np.testing.assert_allclose(results[i].to_numpy(), expected,
+                                       atol=1e-6)
+
+
+def test_results_outlive_close():
+    results = parallel.run_trajectories([{'posX': 5.0}], processes=1)
+    df = results[0]
+    array = results.array(0)
+    packed = results.packed(0)
+    results.close()
+
+    np.testing.assert_array_equal(df['x'], [5, 6, 7])
+    np.testing.assert_array_equal(array, df.to_numpy())
+    np.testing.assert_array_equal(packed.unpack(), df.to_numpy())
+
+
+def test_view_opt_in():
+    with parallel.run_trajectories([{'posX': 5.0}], processes=1) as results:
+        view = results.array(0, copy=False)
+        view[0, 1] = -1
+        assert results.array(0)[0, 1] == -1
+        assert results.packed(0, copy=False).data[0, 1] == -1
+
+
+def test_close_unlinks_blocks():
+    before = shm_blocks()
+    results = parallel.run_trajectories([{'posX': i} for i in range(6)],
+                                        processes=2, chunksize=2)
+    assert len(shm_blocks() - before) == 3
+    results.close()
+    assert shm_blocks() - before == set()
+
+
+def test_failure_unlinks_every_block():
+    kwargs = [{'posX': i} for i in range(8)]
+    kwargs[5]['fail'] = True
+
+    before = shm_blocks()
+    with pytest.raises(RuntimeError, match='fragment 5 failed'):
+        parallel.run_trajectories(kwargs, processes=2, chunksize=2)
+    assert shm_blocks() - before == set()
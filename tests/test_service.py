@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+service = pytest.importorskip('kinematics.service')
+SimulationService = service.SimulationService
+
+COLUMNS = ['t', 'x', 'y', 'z']
+
+
+class FakeWorker:
+    """Stands in for service._run_requests.  Records every call and returns
+        a one-row trajectory at posX, or a ValueError for fail=True.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+
+    def __call__(self, requests):
+        self.calls.append(requests)
+        results = []
+        for fragment_kwargs, dt, lowerKineticLimit, lowerVelLimit in requests:
+            if fragment_kwargs.get('fail'):
+                results.append(ValueError('bad fragment'))
+            else:
+                results.append((COLUMNS, np.array(
+                    [[0., fragment_kwargs.get('posX', 0), 0., 0.]])))
+        return results
+
+
+    @property
+    def requests(self):
+        return [r for call in self.calls for r in call]
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    fake = FakeWorker()
+    monkeypatch.setattr(service, '_run_requests', fake)
+    return fake
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 10))
+
+
+def make_service(**kwargs):
+    kwargs.setdefault('executor', ThreadPoolExecutor(2))
+    kwargs.setdefault('workers', 2)
+    return SimulationService(**kwargs)
+
+
+def test_identical_submits_share_one_computation(worker):
+    async def main():
+        async with make_service(batch_window=0.05) as svc:
+            return await asyncio.gather(*[svc.submit({'posX': 3.0})
+                                          for _ in range(20)])
+
+    results = run(main())
+    assert len(worker.requests) == 1
+    assert all(df['x'].iloc[0] == 3.0 for df in results)
+
+
+def test_int_and_float_arguments_are_the_same_request(worker):
+    async def main():
+        async with make_service() as svc:
+            a = await svc.request_key({'posX': 1, 'mass': 2}, 0.001, 100, 0)
+            b = await svc.request_key({'posX': 1.0, 'mass': 2.0}, 0.001,
+                                      100.0, 0.0)
+            c = await svc.request_key({'posX': 1.5, 'mass': 2}, 0.001, 100, 0)
+            await svc.submit({'posX': 1})
+            await svc.submit({'posX': 1.0})
+            return a, b, c
+
+    a, b, c = run(main())
+    assert a == b
+    assert a != c
+    assert len(worker.requests) == 1
+
+
+def test_lru_eviction_at_max_cache(worker):
+    async def main():
+        async with make_service(max_cache=2) as svc:
+            await svc.submit({'posX': 1})
+            await svc.submit({'posX': 2})
+            await svc.submit({'posX': 1})    # cached, now most recent
+            await svc.submit({'posX': 3})    # evicts posX=2
+            assert svc.cache_info()['cached'] == 2
+            assert len(worker.requests) == 3
+
+            await svc.submit({'posX': 1})
+            assert len(worker.requests) == 3
+            await svc.submit({'posX': 2})
+            assert len(worker.requests) == 4
+
+    run(main())
+
+
+def test_exceptions_are_not_cached(worker):
+    async def main():
+        async with make_service() as svc:
+            for _ in range(2):
+                with pytest.raises(ValueError, match='bad fragment'):
+                    await svc.submit({'posX': 1, 'fail': True})
+            assert svc.cache_info()['cached'] == 0
+            assert svc.cache_info()['in_flight'] == 0
+
+    run(main())
+    assert len(worker.requests) == 2
+
+
+def test_returned_dataframe_does_not_alias_the_cache(worker):
+    async def main():
+        async with make_service() as svc:
+            df = await svc.submit({'posX': 4.0})
+            df.iloc[0, 1] = -99.
+            df['x'] += 1
+            return await svc.submit({'posX': 4.0})
+
+    again = run(main())
+    assert again['x'].iloc[0] == 4.0
+    assert len(worker.requests) == 1
+
+
+def test_submit_before_start_raises(worker):
+    with pytest.raises(RuntimeError, match='not been started'):
+        run(make_service().submit({'posX': 1}))
+
+
+def test_submit_racing_close_raises(worker, monkeypatch):
+    hashing = threading.Event()
+    release = threading.Event()
+
+    def slow_drag_hash(self, path):
+        hashing.set()
+        release.wait(5)
+        return ''
+
+    monkeypatch.setattr(SimulationService, '_drag_hash', slow_drag_hash)
+
+    async def main():
+        svc = make_service()
+        await svc.start()
+        # The submit is past its start check and waiting on its key
+        pending = asyncio.ensure_future(svc.submit({'posX': 1}))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, hashing.wait, 5)
+
+        await svc.close()
+        release.set()
+        with pytest.raises(RuntimeError, match='closed'):
+            await asyncio.wait_for(pending, 5)
+
+        with pytest.raises(RuntimeError, match='closed'):
+            await svc.submit({'posX': 1})
+
+    run(main())
+    assert worker.requests == []
+
+
+def test_close_shuts_down_owned_executor_off_the_loop(worker, monkeypatch):
+    shutdown_threads = []
+
+    class Executor(ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            shutdown_threads.append(threading.current_thread())
+            super().shutdown(*args, **kwargs)
+
+    monkeypatch.setattr(service, 'ProcessPoolExecutor',
+                        lambda workers: Executor(workers))
+
+    async def main():
+        async with SimulationService(workers=2) as svc:
+            await svc.submit({'posX': 1})
+        assert svc._executor is None
+
+    run(main())
+    assert len(shutdown_threads) == 1
+    assert shutdown_threads[0] is not threading.main_thread()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+spawn = pytest.importorskip('kinematics.spawn')
+
+
+ZONES = pd.DataFrame({'count': [60000, 0, 90000],
+                      'azi_min': [0.0, 1.0, -np.pi],
+                      'azi_max': [0.5, 2.0, np.pi],
+                      'elv_min': [-0.2, 0.0, 0.3],
+                      'elv_max': [0.4, 0.1, 1.5],
+                      'velocity': [1500.0, 900.0, 800.0],
+                      'mott_mass': [0.002, 0.01, 0.0005]})
+
+
+@pytest.fixture(scope='module')
+def batch():
+    return spawn.spawn_from_polar_zones(ZONES, posX=1, posY=2, posZ=3, seed=7)
+
+
+def test_shapes_and_zero_count_zone(batch):
+    n = ZONES['count'].sum()
+    for key in ['x', 'y', 'z', 'vx', 'vy', 'vz', 'azi', 'elv', 'velocity',
+                'mass', 'zone']:
+        assert batch[key].shape == (n,)
+
+    np.testing.assert_array_equal(np.bincount(batch['zone'], minlength=3),
+                                  ZONES['count'])
+    np.testing.assert_array_equal(batch['x'], 1)
+    np.testing.assert_array_equal(batch['z'], 3)
+
+
+def test_every_zone_empty():
+    zones = ZONES.assign(count=0)
+    batch = spawn.spawn_from_polar_zones(zones, seed=0)
+    assert all(len(v) == 0 for v in batch.values())
+    assert list(spawn.fragment_kwargs(batch)) == []
+
+
+def test_negative_count_raises():
+    with pytest.raises(ValueError):
+        spawn.spawn_from_polar_zones(ZONES.assign(count=[1, -1, 1]))
+
+
+def test_missing_column_raises():
+    with pytest.raises(ValueError):
+        spawn.spawn_from_polar_zones(ZONES.drop(columns='mott_mass'))
+
+
+def test_speed_matches_zone_velocity(batch):
+    speed = np.sqrt(batch['vx'] ** 2 + batch['vy'] ** 2 + batch['vz'] ** 2)
+    expected = ZONES['velocity'].to_numpy()[batch['zone']]
+    np.testing.assert_allclose(speed, expected)
+    np.testing.assert_allclose(batch['velocity'], expected)
+
+
+def test_directions_within_bounds_and_uniform_in_sin_elevation(batch):
+    for i, row in ZONES.iterrows():
+        if row['count'] == 0:
+            continue
+        mine = batch['zone'] == i
+        azi, elv = batch['azi'][mine], batch['elv'][mine]
+        assert azi.min() >= row['azi_min'] and azi.max() <= row['azi_max']
+        assert elv.min() >= row['elv_min'] and elv.max() <= row['elv_max']
+
+        # Uniform in solid angle: sin(elevation) fills its range evenly
+        lo, hi = np.sin(row['elv_min']), np.sin(row['elv_max'])
+        u = (np.sin(elv) - lo) / (hi - lo)
+        fractions = np.histogram(u, bins=10, range=(0, 1))[0] / len(u)
+        np.testing.assert_allclose(fractions, 0.1, atol=0.006)
+
+
+def test_mott_tail(batch):
+    # N(>m) = N0 exp(-sqrt(m / mott_mass)), so P(m > mott_mass) = 1/e
+    for i, row in ZONES.iterrows():
+        if row['count'] == 0:
+            continue
+        mass = batch['mass'][batch['zone'] == i]
+        assert np.all(mass >= 0)
+        assert np.mean(mass > row['mott_mass']) == \
+            pytest.approx(np.exp(-1), abs=0.006)
+        assert np.mean(mass > 4 * row['mott_mass']) == \
+            pytest.approx(np.exp(-2), abs=0.006)
+
+
+def test_seed_is_reproducible():
+    a = spawn.spawn_from_polar_zones(ZONES, seed=3)
+    b = spawn.spawn_from_polar_zones(ZONES, seed=3)
+    for key in a:
+        np.testing.assert_array_equal(a[key], b[key])
+
+
+def test_velocity_std_spreads_and_clips():
+    zones = ZONES.assign(velocity_std=[100.0, 0.0, 2000.0])
+    batch = spawn.spawn_from_polar_zones(zones, seed=1)
+    first = batch['velocity'][batch['zone'] == 0]
+    assert np.std(first) == pytest.approx(100, rel=0.05)
+    assert np.all(batch['velocity'] >= 0)
+
+
+def test_fragment_kwargs_keys_and_values(batch):
+    small = {k: v[:5] for k, v in batch.items()}
+    kwargs = list(spawn.fragment_kwargs(small, dragFile='drag.csv'))
+
+    assert len(kwargs) == 5
+    for i, k in enumerate(kwargs):
+        assert set(k) == {'posX', 'posY', 'posZ', 'initVelocity', 'azimuth',
+                          'elevation', 'mass', 'dragFile'}
+        assert k['dragFile'] == 'drag.csv'
+        assert k['posY'] == 2.0
+        assert k['initVelocity'] == small['velocity'][i]
+        assert k['azimuth'] == small['azi'][i]
+        assert k['elevation'] == small['elv'][i]
+        assert k['mass'] == small['mass'][i]
+        assert all(type(k[c]) is float for c in k if c != 'dragFile')
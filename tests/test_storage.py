@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+storage = pytest.importorskip('kinematics.storage')
+DEFAULT_RESOLUTION = storage.DEFAULT_RESOLUTION
+pack = storage.pack
+pack_batch = storage.pack_batch
+
+COLUMNS = ['t', 'x', 'y', 'z', 'vx', 'vy', 'vz', 'azi', 'elv']
+
+
+def trajectory(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(-1, 1, (rows, len(COLUMNS)))
+    data *= [10, 3e4, 3e4, 1e4, 800, 800, 800, 3, 1.5]
+    data[:, 1:3] += [4e6, 1e6]
+    return data
+
+
+def test_float64_round_trip_is_exact():
+    data = trajectory()
+    packed = pack(data, COLUMNS, precision='float64')
+    np.testing.assert_array_equal(packed.unpack(), data)
+
+
+def test_float32_halves_storage():
+    data = trajectory()
+    packed = pack(data, COLUMNS, precision='float32')
+    assert packed.data.dtype == np.float32
+    assert packed.nbytes == data.nbytes // 2
+    # Relative to the launch point float32 keeps positions within a few mm
+    np.testing.assert_allclose(packed.unpack(), data, atol=5e-3)
+
+
+def test_quantized_round_trip_within_half_step():
+    data = trajectory()
+    packed = pack(data, COLUMNS, precision='quantized')
+    assert packed.data.dtype == np.int32
+
+    step = np.array([DEFAULT_RESOLUTION[c] for c in COLUMNS])
+    error = np.abs(packed.unpack() - data)
+    assert np.all(error <= step / 2 + 1e-9 * np.abs(data))
+
+
+def test_quantized_overflow_raises():
+    data = trajectory()
+    with pytest.raises(ValueError):
+        pack(data, COLUMNS, precision='quantized', origin=(0, 0, 0),
+             resolution={'x': 1e-6})
+
+
+@pytest.mark.parametrize('value', [np.nan, np.inf, -np.inf])
+def test_quantized_non_finite_raises(value):
+    data = trajectory()
+    data[7, 4] = value
+    with pytest.raises(ValueError, match='non-finite'):
+        pack(data, COLUMNS, precision='quantized')
+
+
+def test_quantized_time_covers_long_flights():
+    # Past the ~2147 s an int32 covers at a 1 us step
+    data = trajectory(rows=3)
+    data[:, 0] = [0, 3600, 86400]
+    packed = pack(data, COLUMNS, precision='quantized')
+    np.testing.assert_allclose(packed.unpack()[:, 0], data[:, 0],
+                               atol=DEFAULT_RESOLUTION['t'] / 2)
+
+
+def test_origin_is_matched_by_axis():
+    columns = ['t', 'x', 'z', 'vx']
+    data = np.array([[0., 100., 0., 1.], [1., 110., 5., 1.]])
+    packed = pack(data, columns, precision='float32', origin=(100, 7, 0))
+    np.testing.assert_array_equal(packed.offset, [0, 100, 0, 0])
+    np.testing.assert_allclose(packed.unpack(), data)
+
+
+def test_pack_batch_round_trip():
+    batch = {'x': np.full(4, 10.), 'mass': np.array([.1, .2, .3, .4]),
+             'zone': np.array([0, 0, 1, 1])}
+    packed = pack_batch(batch, precision='quantized')
+    assert packed.columns == ['x', 'mass']
+    np.testing.assert_allclose(packed.unpack(),
+                               np.column_stack((batch['x'], batch['mass'])))
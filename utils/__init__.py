@@ -5,4 +5,7 @@ from .coordinate_frame import CoordinateFrame, BaseFrame
 from .point import Point
 from .cartesian_frame import CartesianFrame 
 from .velocity import Velocity 
-from .state import State 
\ No newline at end of file
+from .state import State 
+from .attitude import Attitude, interpolate_attitude 
+from .geodetic_frame import EarthFrame, ECEFFrame, GeodeticFrame, LocalTangentFrame 
+from .geodetic_frame import transform_coords, lla_to_ecef, ecef_to_lla 
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import quaternion
+from astropy import units
+from measures.api import Angle
+
+
+class Attitude:
+    """Represents the orientation of N bodies (i.e. fragments) as an array of
+        unit quaternions.  Each quaternion rotates body-frame vectors into
+        the reference frame the positions and velocities are described in.
+
+        Attributes:
+            orientation <numpy.ndarray of quaternion> shape (N,)
+    """
+
+    def __init__(self, orientation):
+
+        if isinstance(orientation, np.quaternion):
+            orientation = np.array([orientation], dtype=np.quaternion)
+
+        if not (isinstance(orientation, np.ndarray) and
+                orientation.dtype == np.quaternion):
+            raise TypeError('Expected input orientation to be a quaternion or '
+                            'a numpy array of quaternions.')
+
+        self.orientation = orientation.reshape(-1).copy()
+
+
+    @classmethod
+    def identity(cls, n):
+        """Returns an Attitude of n bodies aligned with the reference frame.
+        """
+        return cls(np.full(n, quaternion.one, dtype=np.quaternion))
+
+
+    @classmethod
+    def from_euler_angles(cls, angles):
+        """Returns an Attitude from an (N, 3) array of (alpha, beta, gamma)
+            euler angles in radians, or a list/tuple of three Angle.  Uses
+            the same convention as CoordinateFrame.
+        """
+        if (isinstance(angles, (list, tuple)) and
+                all(isinstance(i, Angle) for i in angles)):
+            angles = [i.to(units.rad).value for i in angles]
+
+        angles = np.asarray(angles, dtype=np.float64).reshape(-1, 3)
+        return cls(quaternion.from_euler_angles(angles))
+
+
+    def __len__(self):
+        return len(self.orientation)
+
+
+    def __getitem__(self, key):
+        return Attitude(np.atleast_1d(self.orientation[key]))
+
+
+    def __str__(self):
+        return "{0}(N={1})".format(self.__class__.__name__, len(self))
+
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__,
+                                 repr(self.orientation))
+
+
+    def propagate(self, angular_velocity, dt):
+        """Returns the attitude after rotating every body by its body-frame
+            angular velocity for dt seconds.
+            Input attitude is not mutated.
+
+            angular_velocity (numpy.ndarray) shape (N, 3) or (3,), rad/s
+            dt (float or numpy.ndarray of shape (N,)), seconds
+        """
+        omega = np.broadcast_to(np.asarray(angular_velocity, dtype=np.float64),
+                                (len(self), 3))
+        dt = np.broadcast_to(np.asarray(dt, dtype=np.float64), (len(self),))
+        delta = quaternion.from_rotation_vector(omega * dt[:, None])
+        orientation = self.orientation * delta
+        return Attitude(orientation / np.abs(orientation))
+
+
+    def rotate(self, vectors):
+        """Returns body-frame vectors expressed in the reference frame.
+
+            vectors (numpy.ndarray) shape (N, 3), or (3,) to apply the same
+            body vector to every body.
+            Returns numpy.ndarray of shape (N, 3).
+        """
+        vectors = np.broadcast_to(np.asarray(vectors, dtype=np.float64),
+                                  (len(self), 3))
+        matrices = quaternion.as_rotation_matrix(self.orientation)
+        return np.einsum('nij,nj->ni', matrices, vectors)
+
+
+    def inverse_rotate(self, vectors):
+        """Returns reference-frame vectors expressed in each body frame.
+            Inverse of rotate.
+        """
+        vectors = np.broadcast_to(np.asarray(vectors, dtype=np.float64),
+                                  (len(self), 3))
+        matrices = quaternion.as_rotation_matrix(self.orientation)
+        return np.einsum('nji,nj->ni', matrices, vectors)
+
+
+    def slerp(self, other, tau):
+        """Returns the spherical linear interpolation from self (tau=0) to
+            other (tau=1).  Takes the shorter arc for every body.
+        """
+        if len(self) != len(other):
+            raise ValueError('Expected {0} and {1} to describe the same number '
+                             'of bodies.'.format(self, other))
+        return Attitude(_slerp(self.orientation, other.orientation, tau))
+
+
+
+def interpolate_attitude(times, samples, t):
+    """Returns an Attitude at time t from attitudes stored at sample times.
+
+        times (numpy.ndarray) shape (M,), increasing
+        samples (list(Attitude)) length M, all describing the same N bodies
+        t (float)
+            Clamped to the range of times.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if len(times) != len(samples):
+        raise ValueError('Expected one Attitude sample per entry in times.')
+
+    t = float(np.clip(t, times[0], times[-1]))
+    idx = int(np.clip(np.searchsorted(times, t, side='right') - 1,
+                      0, max(len(times) - 2, 0)))
+    if len(times) == 1:
+        return Attitude(samples[0].orientation)
+
+    tau = (t - times[idx]) / (times[idx + 1] - times[idx])
+    return samples[idx].slerp(samples[idx + 1], tau)
+
+
+
+def _slerp(q0, q1, tau):
+    """Vectorized shortest-arc slerp between quaternion arrays.
+    """
+    dot = np.sum(quaternion.as_float_array(q0) * quaternion.as_float_array(q1),
+                 axis=-1)
+    q1 = np.where(dot < 0, -q1, q1)
+    tau = np.asarray(tau, dtype=np.float64)
+    return q0 * np.exp(np.log(np.conjugate(q0) * q1) * tau)
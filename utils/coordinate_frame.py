@@ -30,9 +30,14 @@ class BaseFrame(CoordinateFrame):
     """
     origin (Vector3) 
     orientation (quaternion?)
+    anchor (LocalTangentFrame) 
+        Optional.  Places the base frame on the earth: its origin and axes 
+        are taken to be the anchor's.  Required to convert points between 
+        CartesianFrames on this base frame and EarthFrames.  
     """
 
     def __init__(self, origin=Vector3(), 
                  orientation=3 * (Angle(0, units.rad), ),
-                 *args):
+                 *args, anchor=None):
         super().__init__(*args)
+        self.anchor = anchor
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+import abc
+import numpy as np
+from astropy import units
+from measures.api import Angle, Length
+from .coordinate_frame import CoordinateFrame, BaseFrame
+
+
+# WGS84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+WGS84_EP2 = WGS84_E2 / (1 - WGS84_E2)
+
+
+class EarthFrame(CoordinateFrame, abc.ABC):
+    """Base class for frames tied to the WGS84 ellipsoid.  Every EarthFrame
+        converts batches of coordinates to and from ECEF, so a point can be
+        moved between any two of them with transform_coords.
+
+        Coordinates are (N, 3) arrays in meters, except GeodeticFrame which
+        uses (latitude rad, longitude rad, altitude m).
+    """
+
+    def __init__(self, name='earth'):
+        super().__init__(name=name)
+
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, self.name)
+
+
+    @abc.abstractmethod
+    def to_ecef(self, coords):
+        """Converts an (N, 3) array of coordinates in this frame to ECEF.
+        """
+
+
+    @abc.abstractmethod
+    def from_ecef(self, coords):
+        """Converts an (N, 3) array of ECEF coordinates to this frame.
+        """
+
+
+
+class ECEFFrame(EarthFrame):
+    """Earth-centered, earth-fixed cartesian frame.
+    """
+
+    def __init__(self, name='ECEF'):
+        super().__init__(name=name)
+
+
+    def to_ecef(self, coords):
+        return np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+
+
+    def from_ecef(self, coords):
+        return np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+
+
+
+class GeodeticFrame(EarthFrame):
+    """Latitude, longitude, altitude above the WGS84 ellipsoid.
+        Coordinates are (latitude rad, longitude rad, altitude m).
+    """
+
+    def __init__(self, name='LLA'):
+        super().__init__(name=name)
+
+
+    def to_ecef(self, coords):
+        return lla_to_ecef(coords)
+
+
+    def from_ecef(self, coords):
+        return ecef_to_lla(coords)
+
+
+
+class LocalTangentFrame(EarthFrame):
+    """East-north-up or north-east-down cartesian frame tangent to the WGS84
+        ellipsoid at a geodetic origin.  The ECEF rotation and origin are
+        computed once per frame.
+
+        Attributes:
+            latitude, longitude (Angle)
+            altitude (Length)
+            axes_convention (str) ENU or NED
+            rotation (numpy.ndarray) shape (3, 3)
+                Rotates ECEF offsets into the local axes
+            origin_ecef (numpy.ndarray) shape (3,)
+    """
+
+    def __init__(self, latitude=Angle(0, units.rad),
+                 longitude=Angle(0, units.rad),
+                 altitude=Length(0, units.m),
+                 axes_convention='ENU',
+                 name=''):
+
+        if not all(isinstance(i, Angle) for i in (latitude, longitude)):
+            raise TypeError('Expected inputs latitude and longitude to be of '
+                            'type Angle.')
+        if not isinstance(altitude, Length):
+            raise TypeError('Expected input altitude to be of type Length.')
+
+        axes_convention = axes_convention.upper()
+        if axes_convention not in LOCAL_AXES:
+            raise ValueError('Input axes_convention did not match internal '
+                             'dictionary of local tangent axes conventions.')
+
+        super().__init__(name=name or axes_convention)
+
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+        self.axes_convention = axes_convention
+
+        lat = latitude.to(units.rad).value
+        lon = longitude.to(units.rad).value
+        alt = altitude.to(units.m).value
+        self.rotation = LOCAL_AXES[axes_convention] @ enu_rotation(lat, lon)
+        self.origin_ecef = lla_to_ecef([lat, lon, alt])[0]
+
+
+    def __repr__(self):
+        return "{0}({1}, origin: ({2}, {3}, {4}))".format(
+            self.__class__.__name__, self.name, self.latitude,
+            self.longitude, self.altitude)
+
+
+    def to_ecef(self, coords):
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        return coords @ self.rotation + self.origin_ecef
+
+
+    def from_ecef(self, coords):
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        return (coords - self.origin_ecef) @ self.rotation.T
+
+
+
+# Map ENU axes onto each supported local axes convention
+LOCAL_AXES = {
+    'ENU': np.eye(3),
+    'NED': np.array([[0., 1., 0.],
+                     [1., 0., 0.],
+                     [0., 0., -1.]]),
+}
+
+
+
+def earth_anchor(frame):
+    """Returns the EarthFrame that frame's coordinates can be converted
+        through.  EarthFrames are their own anchor.  A CartesianFrame or
+        BaseFrame uses the LocalTangentFrame its BaseFrame is anchored to.
+    """
+    if isinstance(frame, EarthFrame):
+        return frame
+
+    base = frame if isinstance(frame, BaseFrame) \
+        else getattr(frame, 'base_frame', None)
+    anchor = getattr(base, 'anchor', None)
+    if not isinstance(anchor, LocalTangentFrame):
+        raise TypeError('{0} is not anchored to the earth.  Create its '
+                        'BaseFrame with anchor=LocalTangentFrame(...) to '
+                        'convert between it and EarthFrames.'.format(frame))
+    return anchor
+
+
+
+def transform_coords(coords, from_frame, to_frame):
+    """Converts an (N, 3) array of coordinates between two EarthFrames.
+    """
+    if not (isinstance(from_frame, EarthFrame) and
+            isinstance(to_frame, EarthFrame)):
+        raise TypeError('Expected both frames to be of type EarthFrame.')
+
+    if from_frame is to_frame:
+        return np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    return to_frame.from_ecef(from_frame.to_ecef(coords))
+
+
+
+def lla_to_ecef(lla):
+    """Converts an (N, 3) array of (latitude rad, longitude rad, altitude m)
+        to ECEF meters.
+    """
+    lla = np.asarray(lla, dtype=np.float64).reshape(-1, 3)
+    lat, lon, alt = lla[:, 0], lla[:, 1], lla[:, 2]
+
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * sin_lat ** 2)
+
+    return np.column_stack(((n + alt) * cos_lat * np.cos(lon),
+                            (n + alt) * cos_lat * np.sin(lon),
+                            (n * (1 - WGS84_E2) + alt) * sin_lat))
+
+
+
+def ecef_to_lla(xyz, iterations=2):
+    """Converts an (N, 3) array of ECEF meters to (latitude rad,
+        longitude rad, altitude m).  Uses Bowring's method, which is below
+        a millimeter after two iterations for terrestrial altitudes.
+    """
+    xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+
+    p = np.hypot(x, y)
+    lon = np.arctan2(y, x)
+
+    # Parametric latitude initial guess, refined through geodetic latitude
+    beta = np.arctan2(WGS84_A * z, WGS84_B * p)
+    for _ in range(iterations):
+        lat = np.arctan2(z + WGS84_EP2 * WGS84_B * np.sin(beta) ** 3,
+                         p - WGS84_E2 * WGS84_A * np.cos(beta) ** 3)
+        beta = np.arctan2((1 - WGS84_F) * np.sin(lat), np.cos(lat))
+
+    sin_lat = np.sin(lat)
+    alt = p * np.cos(lat) + z * sin_lat \
+        - WGS84_A * np.sqrt(1 - WGS84_E2 * sin_lat ** 2)
+
+    return np.column_stack((lat, lon, alt))
+
+
+
+def enu_rotation(lat, lon):
+    """Returns the (3, 3) matrix that rotates ECEF offsets into east, north,
+        up axes at the given geodetic latitude and longitude (radians).
+    """
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+
+    return np.array([[-sin_lon, cos_lon, 0.],
+                     [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+                     [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat]])
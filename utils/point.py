@@ -8,6 +8,7 @@ from astropy import units
 from measures.api import Length, Angle, UnitsError
 from .vector3 import Vector3
 from .coordinate_frame import CoordinateFrame
+from .geodetic_frame import EarthFrame, GeodeticFrame, earth_anchor, transform_coords
 
 
 class Point:
@@ -172,10 +173,26 @@ class Point:
 
     def to_units_array(self):
         """Returns list of coordinates with associated astropy.units  
+            Points in a GeodeticFrame return (latitude, longitude) as Angles 
+            in radians followed by the altitude.  
         """
+        if isinstance(self._frame, GeodeticFrame):
+            return [Angle(self.coords[0], units.rad), 
+                    Angle(self.coords[1], units.rad), 
+                    Length(self.coords[2], self.units[2])]
         return [Length(self.coords[i], self.units[i]) for i in range(3)]           
 
 
+    def _earth_coords(self):
+        """Returns coordinates in the SI units EarthFrames work in.  
+        """
+        if isinstance(self._frame, GeodeticFrame):
+            lat, lon, alt = self.to_units_array()
+            return [lat.to(units.rad).value, lon.to(units.rad).value, 
+                    alt.to(units.m).value]
+        return [i.to(units.m).value for i in self.to_units_array()]
+
+
     def as_spherical_coords(self):
         """Returns spherical coordinates 
         """
@@ -202,6 +219,27 @@ class Point:
         if self._frame is new_frame: 
             return self
 
+        # Earth frames are related through ECEF rather than a rotation 
+        #   about a shared base frame.  Other frames go through the 
+        #   LocalTangentFrame their base frame is anchored to.  
+        if isinstance(self._frame, EarthFrame) or isinstance(new_frame, EarthFrame):
+            coords = self._earth_coords()
+            if not isinstance(self._frame, EarthFrame):
+                # Undo new_frame's mapping below: remove the origin, then
+                #   rotate back into the anchor's axes  
+                coords = np.subtract(coords, _origin_meters(self._frame))
+                coords = quaternion.rotate_vectors(
+                    np.conjugate(self._frame.orientation), coords)
+
+            x = transform_coords(coords, earth_anchor(self._frame), 
+                                 earth_anchor(new_frame))[0]
+
+            if not isinstance(new_frame, EarthFrame):
+                x = quaternion.rotate_vectors(new_frame.orientation, x)
+                x = _origin_meters(new_frame) + np.around(x, decimals=12)
+            return Point(coords=Vector3(x), frame=new_frame, 
+                         dimension_unit=units.m)
+
         world_coords = quaternion.rotate_vectors(self._frame.orientation, 
                                                  self.coords)
         x = quaternion.rotate_vectors(new_frame.orientation, world_coords)
@@ -222,3 +260,14 @@ class Point:
         coords = self.coords + Vector3(increment)
         return Point(coords=coords, frame=self._frame, 
                      dimension_unit=self.units[0])
+
+
+
+def _origin_meters(frame):
+    """Returns the origin of a CartesianFrame in meters, or zeros for frames
+        without one (i.e. a BaseFrame).
+    """
+    origin = getattr(frame, 'origin', None)
+    if isinstance(origin, Point):
+        return np.array([i.to(units.m).value for i in origin.to_units_array()])
+    return np.zeros(3)
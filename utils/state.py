@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from .point import Point 
 from .velocity import Velocity  
+from .attitude import Attitude 
 
 
 class State():
@@ -10,11 +11,12 @@ class State():
     position <utils.Point>
     velocity <utils.Velocity>
         velocity has an orientation that points towards the trajectory arc 
-
-    TODO: orientation (the way the fragment is facing)
+    orientation <utils.Attitude> (optional)
+        the way the fragment is facing, described in reference to the same 
+        frame as position and velocity 
     """
 
-    def __init__(self, position, velocity):
+    def __init__(self, position, velocity, orientation=None):
 
         if not isinstance(position, Point):
             raise TypeError('Expected input position to be of type ' 
@@ -30,15 +32,28 @@ class State():
                              'described in reference to the same '
                              'CartesianFrame')
 
+        if orientation is not None and not isinstance(orientation, Attitude):
+            raise TypeError('Expected input orientation to be of type ' 
+                            'kinematics.utils.Attitude')
+
         self.position = position 
         self.velocity = velocity
+        self.orientation = orientation
 
 
     def __str__(self):
+        if self.orientation is not None:
+            return "{0}({1}, {2}, {3})".format(self.__class__.__name__, 
+                                               self.position, self.velocity, 
+                                               self.orientation)
         return "{0}({1}, {2})".format(self.__class__.__name__, 
                                       self.position, self.velocity)
 
 
     def __repr__(self):
+        if self.orientation is not None:
+            return "{0}({1}, {2}, {3!r})".format(self.__class__.__name__, 
+                                                 self.position, self.velocity, 
+                                                 self.orientation)
         return "{0}({1}, {2})".format(self.__class__.__name__, 
                                       self.position, self.velocity)
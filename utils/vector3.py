@@ -15,7 +15,7 @@ class Vector3(np.ndarray):
             if isinstance(args[0], np.matrix):
                 return Vector3(args[0].flatten().tolist()[0])
         data = _massage_args(args)
-        array = np.array(data, dtype=np.float, copy=True)
+        array = np.array(data, dtype=np.float64, copy=True)
         return np.ndarray.__new__(cls, shape=(3,), buffer=array)
 
 